@@ -9,12 +9,59 @@ import os
 import sys
 import json
 import csv
+import math
+import mmap
 import glob
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import re
 
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional; fall back to the csv module
+    pd = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the json module
+    orjson = None
+
+# Logs are scanned as raw bytes; only the small matched groups are decoded.
+# Gate and metric lines share one alternation, so each line is scanned in a single pass.
+# Named groups let parse_log_file dispatch on match.lastgroup. Metrics must occupy a
+# whole line ("Name: 1.23") with a bounded name, so the branch fails immediately
+# everywhere except at the start of a line instead of matching any "word: number".
+COMBINED_RE = re.compile(
+    rb"(?P<gate>\[\w+\] Gate '(?P<gate_name>[^']+)': (?P<gate_result>PASS|FAIL))"
+    rb"|(?P<metric>^\s*(?P<metric_name>\w{1,64}):\s+(?P<metric_value>[\d.]+)\s*$)"
+)
+
+# The build ID is printed in the log header, so only the first LOG_HEADER_BYTES are searched
+BUILD_ID_RE = re.compile(rb'Build ID: ([^\s\n]+)')
+LOG_HEADER_BYTES = 64 * 1024
+
+# Logs larger than this are memory-mapped rather than read through a file buffer
+LOG_MMAP_MIN_BYTES = 1024 * 1024
+
+# Bump whenever parse_log_file output changes so stale cached results are not reused
+PARSE_CACHE_VERSION = 5
+
+# CSV reports are aggregated in chunks of this many rows
+CSV_CHUNK_ROWS = 100000
+
+# Matches CSV cells that float() would accept as a plain decimal or exponent number
+NUMERIC_RE = re.compile(r'\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*')
+
+def iter_log_lines(f):
+    """Yield the raw byte lines of an open log, memory-mapping large files."""
+    if os.fstat(f.fileno()).st_size >= LOG_MMAP_MIN_BYTES:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from iter(mapped.readline, b'')
+    else:
+        yield from f
+
 def parse_log_file(log_path):
     """Parse Unity log file to extract performance gate results."""
     results = {
@@ -25,35 +72,47 @@ def parse_log_file(log_path):
         'timestamp': None
     }
     
+    metrics = {}
+    build_id = None
+    all_passed = False
+    header_bytes = 0
+    
     try:
-        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-            
-        # Extract build ID
-        build_id_match = re.search(r'Build ID: ([^\s\n]+)', content)
-        if build_id_match:
-            results['build_id'] = build_id_match.group(1)
-        
-        # Extract overall result
-        if 'ALL PERFORMANCE GATES PASSED' in content:
-            results['overall_success'] = True
-        elif 'PERFORMANCE GATES FAILED' in content:
-            results['overall_success'] = False
-        
-        # Extract individual gate results
-        gate_pattern = r'\[(\w+)\] Gate \'([^\']+)\': (PASS|FAIL)'
-        for match in re.finditer(gate_pattern, content):
-            gate_name = match.group(2)
-            gate_result = match.group(3) == 'PASS'
-            results['gates'][gate_name] = gate_result
+        # Stream line by line so peak memory stays bounded regardless of log size
+        with open(log_path, 'rb') as f:
+            for line in iter_log_lines(f):
+                if build_id is None and header_bytes < LOG_HEADER_BYTES:
+                    header_bytes += len(line)
+                    build_id_match = BUILD_ID_RE.search(line)
+                    if build_id_match:
+                        build_id = build_id_match.group(1).decode('utf-8', 'ignore')
+                
+                # Plain substring checks are much cheaper than the regex engine.
+                # The last verdict wins, so a retried run reports its final outcome.
+                if b'PERFORMANCE GATES' in line:
+                    if b'ALL PERFORMANCE GATES PASSED' in line:
+                        all_passed = True
+                    elif b'PERFORMANCE GATES FAILED' in line:
+                        all_passed = False
+                
+                # Every gate and metric line contains a colon; skip the rest unscanned
+                if b':' not in line:
+                    continue
+                for match in COMBINED_RE.finditer(line):
+                    if match.lastgroup == 'gate':
+                        gate_name = match.group('gate_name').decode('utf-8', 'ignore')
+                        results['gates'][gate_name] = match.group('gate_result') == b'PASS'
+                    else:
+                        metric_name = match.group('metric_name').decode('ascii')
+                        try:
+                            metrics[metric_name] = float(match.group('metric_value'))
+                        except ValueError:
+                            # [\d.]+ also matches values like '1.2.3'; skip just that metric
+                            continue
         
-        # Extract performance metrics
-        metrics_pattern = r'(\w+): ([\d.]+)'
-        metrics = {}
-        for match in re.finditer(metrics_pattern, content):
-            metric_name = match.group(1)
-            metric_value = float(match.group(2))
-            metrics[metric_name] = metric_value
+        if build_id is not None:
+            results['build_id'] = build_id
+        results['overall_success'] = all_passed
         
         results['metrics'] = metrics
         
@@ -62,36 +121,181 @@ def parse_log_file(log_path):
     
     return results
 
+def merge_column_stats(columns, col, count, min_val, max_val, total):
+    """Fold one batch of values for a CSV column into its running aggregates."""
+    stats = columns.get(col)
+    if stats is None:
+        columns[col] = {'count': count, 'min': min_val, 'max': max_val, 'sum': total}
+    else:
+        stats['count'] += count
+        stats['min'] = min(stats['min'], min_val)
+        stats['max'] = max(stats['max'], max_val)
+        stats['sum'] += total
+
+def fold_pending_values(columns, header, pending, positions):
+    """Fold buffered CSV values into the running aggregates and clear the buffers."""
+    for i in positions:
+        values = pending[i]
+        if values:
+            merge_column_stats(columns, header[i], len(values), min(values), max(values), math.fsum(values))
+            values.clear()
+
+def dedupe_header(header):
+    """Name CSV columns the way pandas does: blank names become 'Unnamed: i', repeats get '.1', '.2'."""
+    names = [name or f'Unnamed: {i}' for i, name in enumerate(header)]
+    # Given names are kept in preference to generated ones, so blank columns are renamed last
+    unnamed = [i for i, name in enumerate(header) if not name]
+    order = [i for i, name in enumerate(header) if name] + unnamed
+    counts = {}
+    for i in order:
+        base = name = names[i]
+        count = counts.get(name, 0)
+        # Suffixes that are already another column's name ('a,a,a.1') are skipped
+        while count:
+            counts[base] = count + 1
+            name = f'{base}.{count}'
+            count = count + 1 if name in names else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
 def parse_csv_report(csv_path):
-    """Parse CSV performance report."""
-    data = []
+    """Parse CSV performance report into per-column aggregates.
+    
+    Rows are reduced as they are read and then discarded. Returns a dict with the
+    'row_count' and 'columns' mapping each numeric column to its count, min, max and sum.
+    Both backends agree on what is numeric: a column with any cell other than a finite
+    decimal number (including 'inf', 'nan' or 'NA') is text and left out.
+    """
+    data = {'row_count': 0, 'columns': {}}
+    columns = {}
+    text_columns = set()
     try:
-        with open(csv_path, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Convert numeric fields
-                for key, value in row.items():
-                    try:
-                        row[key] = float(value)
-                    except (ValueError, TypeError):
-                        pass  # Keep as string
-                data.append(row)
+        if pd is not None:
+            # C-level typed parsing, one bounded chunk of rows at a time. Only empty
+            # cells are missing values, so 'nan' and 'NA' make a column text as in the
+            # csv module path.
+            try:
+                chunks = pd.read_csv(
+                    csv_path, chunksize=CSV_CHUNK_ROWS, keep_default_na=False, na_values=['']
+                )
+                for chunk in chunks:
+                    data['row_count'] += len(chunk)
+                    numeric = chunk.select_dtypes('number')
+                    text_columns.update(col for col in chunk.columns if col not in numeric.columns)
+                    if numeric.columns.empty:
+                        continue
+                    chunk_stats = numeric.agg(['count', 'min', 'max', 'sum'])
+                    for col in numeric.columns:
+                        count = int(chunk_stats.at['count', col])
+                        if not count:
+                            continue
+                        min_val = float(chunk_stats.at['min', col])
+                        max_val = float(chunk_stats.at['max', col])
+                        # pandas parses 'inf'; NUMERIC_RE does not, so such columns are text
+                        if math.isinf(min_val) or math.isinf(max_val):
+                            text_columns.add(col)
+                            continue
+                        merge_column_stats(
+                            columns, col, count, min_val, max_val, float(chunk_stats.at['sum', col])
+                        )
+            except pd.errors.EmptyDataError:
+                pass  # an empty file is an empty report, as in the csv module path
+        else:
+            with open(csv_path, 'r', newline='') as f:
+                reader = csv.reader(f)
+                # Blank lines are skipped, including before the header, as pandas does
+                header = dedupe_header(next((row for row in reader if row), []))
+                width = len(header)
+                # Values of each column position for the current chunk of rows, folded
+                # into the column aggregates with C-level min/max/math.fsum once per
+                # chunk. A column leaves the mask of numeric positions at its first
+                # text cell, so later rows never look at it again.
+                pending = [[] for _ in header]
+                numeric_positions = list(range(width))
+                is_numeric = NUMERIC_RE.fullmatch
+                for row in reader:
+                    if not row:
+                        continue
+                    data['row_count'] += 1
+                    if len(row) < width:
+                        row += [''] * (width - len(row))
+                    ruled_out = []
+                    for i in numeric_positions:
+                        cell = row[i]
+                        if not cell:
+                            continue
+                        if is_numeric(cell):
+                            pending[i].append(float(cell))
+                        else:
+                            ruled_out.append(i)
+                    if ruled_out:
+                        text_columns.update(header[i] for i in ruled_out)
+                        numeric_positions = [i for i in numeric_positions if i not in ruled_out]
+                    if data['row_count'] % CSV_CHUNK_ROWS == 0:
+                        fold_pending_values(columns, header, pending, numeric_positions)
+                fold_pending_values(columns, header, pending, numeric_positions)
+        
+        data['columns'] = {col: stats for col, stats in columns.items() if col not in text_columns}
     except Exception as e:
         print(f"Error parsing CSV file {csv_path}: {e}")
     
     return data
 
 def parse_json_report(json_path):
-    """Parse JSON performance report."""
+    """Parse JSON performance report.
+    
+    Returns (data, non_finite), where non_finite records whether the report holds
+    NaN or Infinity values.
+    """
+    non_finite = []
+    
+    def parse_constant(name):
+        non_finite.append(name)
+        return float(name)
+    
     try:
-        with open(json_path, 'r') as f:
-            return json.load(f)
+        data = Path(json_path).read_bytes()
+        if orjson is not None:
+            try:
+                return orjson.loads(data), False
+            except orjson.JSONDecodeError:
+                # orjson rejects the NaN/Infinity literals json.dump writes by default and
+                # numbers that overflow to infinity; the json module accepts them, so
+                # both backends parse the same reports
+                return json.loads(data), True
+        report = json.loads(data, parse_constant=parse_constant)
+        return report, bool(non_finite)
     except Exception as e:
         print(f"Error parsing JSON file {json_path}: {e}")
+        return {}, False
+
+def load_parse_cache(cache_path):
+    """Load cached log parse results, keyed by log path."""
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
         return {}
+    # Results written by an older version of the log parser are discarded
+    if cache.get('version') != PARSE_CACHE_VERSION:
+        return {}
+    return cache.get('logs', {})
+
+def save_parse_cache(cache_path, cache):
+    """Persist log parse results for reuse by the next analysis run."""
+    try:
+        with open(cache_path, 'w') as f:
+            json.dump({'version': PARSE_CACHE_VERSION, 'logs': cache}, f)
+    except OSError as e:
+        print(f"Warning: could not write parse cache {cache_path}: {e}")
 
-def analyze_artifacts_directory(artifacts_dir):
-    """Analyze all performance artifacts in the directory."""
+def analyze_artifacts_directory(artifacts_dir, cache_path=None):
+    """Analyze all performance artifacts in the directory.
+    
+    When cache_path is given, log files whose mtime and size are unchanged
+    since the previous run reuse their cached parse results.
+    """
     artifacts_path = Path(artifacts_dir)
     analysis = {
         'summary': {
@@ -99,6 +303,9 @@ def analyze_artifacts_directory(artifacts_dir):
             'passed_gates': 0,
             'failed_gates': 0,
             'overall_success': False,
+            # Set when a report holds NaN/Infinity, so full-analysis.json is written with
+            # the json module (orjson would turn them into null)
+            'non_finite_values': False,
             'analysis_timestamp': datetime.utcnow().isoformat()
         },
         'gates': {},
@@ -108,41 +315,100 @@ def analyze_artifacts_directory(artifacts_dir):
     
     print(f"Analyzing artifacts in: {artifacts_dir}")
     
-    # Find and parse log files
-    log_files = list(artifacts_path.glob('**/performance-gates.log'))
-    log_files.extend(list(artifacts_path.glob('**/*.log')))
+    # Classify every artifact in a single directory walk rather than one
+    # recursive glob per file type. Each log is collected exactly once, so
+    # performance-gates.log is no longer parsed twice.
+    log_files, csv_files, json_files = [], [], []
+    for root, _, files in os.walk(artifacts_path):
+        for name in files:
+            if name.endswith('.log'):
+                log_files.append(Path(root, name))
+            elif name.endswith('.csv'):
+                csv_files.append(Path(root, name))
+            elif name.endswith('.json'):
+                json_files.append(Path(root, name))
+    
+    # Logs are merged in a fixed order: dedicated performance-gates.log files
+    # last, so their verdicts take precedence over gates echoed in other logs.
+    log_files.sort(key=lambda path: (path.name == 'performance-gates.log', str(path)))
+    previous_cache = load_parse_cache(cache_path) if cache_path else {}
+    log_stats = {}
+    log_results_by_file = {}
+    stale_logs = []
+    for log_file in log_files:
+        try:
+            stat = log_file.stat()
+        except OSError:
+            # A dangling symlink or a log removed since the walk: parse_log_file
+            # reports the error, and the result is not cached
+            stat = None
+        log_stats[log_file] = stat
+        cached = previous_cache.get(str(log_file.resolve())) if stat else None
+        if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+            print(f"Using cached results for log file: {log_file}")
+            log_results_by_file[log_file] = cached['results']
+        else:
+            print(f"Parsing log file: {log_file}")
+            stale_logs.append(log_file)
+    for csv_file in csv_files:
+        print(f"Parsing CSV file: {csv_file}")
+    for json_file in json_files:
+        print(f"Parsing JSON file: {json_file}")
+    
+    # Each file parses independently, so the CPU-bound parsing is spread over
+    # worker processes. A single file is parsed in-process to skip pool startup.
+    pending = len(stale_logs) + len(csv_files) + len(json_files)
+    executor = ProcessPoolExecutor() if pending > 1 else None
+    try:
+        parse_map = executor.map if executor else map
+        log_results_by_file.update(zip(stale_logs, parse_map(parse_log_file, stale_logs)))
+        csv_results = list(parse_map(parse_csv_report, csv_files))
+        json_results = list(parse_map(parse_json_report, json_files))
+    finally:
+        if executor:
+            executor.shutdown()
     
+    # Merge log results
+    parse_cache = {}
     for log_file in log_files:
-        print(f"Parsing log file: {log_file}")
-        log_results = parse_log_file(log_file)
+        log_results = log_results_by_file[log_file]
+        stat = log_stats[log_file]
+        if stat:
+            parse_cache[str(log_file.resolve())] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'results': log_results
+            }
         
         # Merge gate results
-        for gate_name, gate_result in log_results['gates'].items():
-            analysis['gates'][gate_name] = gate_result
-            analysis['summary']['total_gates'] += 1
-            if gate_result:
-                analysis['summary']['passed_gates'] += 1
-            else:
-                analysis['summary']['failed_gates'] += 1
+        analysis['gates'].update(log_results['gates'])
         
         # Update overall success
         if log_results['overall_success']:
             analysis['summary']['overall_success'] = True
     
-    # Find and parse CSV reports
-    csv_files = list(artifacts_path.glob('**/*.csv'))
-    for csv_file in csv_files:
-        print(f"Parsing CSV file: {csv_file}")
-        csv_data = parse_csv_report(csv_file)
-        if csv_data:
+    if cache_path:
+        save_parse_cache(cache_path, parse_cache)
+    
+    # Count each gate once, even when it is reported by several logs
+    passed_gates = sum(1 for gate_result in analysis['gates'].values() if gate_result)
+    analysis['summary']['total_gates'] = len(analysis['gates'])
+    analysis['summary']['passed_gates'] = passed_gates
+    analysis['summary']['failed_gates'] = len(analysis['gates']) - passed_gates
+    
+    # Merge CSV reports
+    for csv_file, csv_data in zip(csv_files, csv_results):
+        if csv_data['row_count']:
             report_name = csv_file.stem
             analysis['performance_data'][report_name] = csv_data
+            # Cells are finite, but a column sum can still overflow to inf
+            if not all(math.isfinite(stats['sum']) for stats in csv_data['columns'].values()):
+                analysis['summary']['non_finite_values'] = True
     
-    # Find and parse JSON reports
-    json_files = list(artifacts_path.glob('**/*.json'))
-    for json_file in json_files:
-        print(f"Parsing JSON file: {json_file}")
-        json_data = parse_json_report(json_file)
+    # Merge JSON reports
+    for json_file, (json_data, non_finite) in zip(json_files, json_results):
+        if non_finite:
+            analysis['summary']['non_finite_values'] = True
         if json_data:
             analysis['reports'].append({
                 'name': json_file.stem,
@@ -152,104 +418,103 @@ def analyze_artifacts_directory(artifacts_dir):
     
     return analysis
 
+def numeric_column_stats(data):
+    """Return (column, min, max, average) for each numeric column of a parsed CSV report."""
+    return [
+        (col, stats['min'], stats['max'], stats['sum'] / stats['count'])
+        for col, stats in data['columns'].items()
+    ]
+
 def generate_summary_report(analysis, output_dir):
     """Generate a summary report in markdown format."""
     output_path = Path(output_dir) / 'performance-analysis-summary.md'
     
-    with open(output_path, 'w') as f:
-        f.write("# Performance Gates Analysis Summary\n\n")
-        f.write(f"**Analysis Timestamp**: {analysis['summary']['analysis_timestamp']}\n\n")
-        
-        # Overall status
-        status_emoji = "✅" if analysis['summary']['overall_success'] else "❌"
-        status_text = "PASSED" if analysis['summary']['overall_success'] else "FAILED"
-        f.write(f"## Overall Status: {status_emoji} {status_text}\n\n")
-        
-        # Summary statistics
-        f.write("## Summary Statistics\n\n")
-        f.write(f"- **Total Gates**: {analysis['summary']['total_gates']}\n")
-        f.write(f"- **Passed Gates**: {analysis['summary']['passed_gates']}\n")
-        f.write(f"- **Failed Gates**: {analysis['summary']['failed_gates']}\n")
-        
-        if analysis['summary']['total_gates'] > 0:
-            success_rate = (analysis['summary']['passed_gates'] / analysis['summary']['total_gates']) * 100
-            f.write(f"- **Success Rate**: {success_rate:.1f}%\n")
+    # Accumulate the report and write it in one call rather than many small writes
+    parts = []
+    parts.append("# Performance Gates Analysis Summary\n\n")
+    parts.append(f"**Analysis Timestamp**: {analysis['summary']['analysis_timestamp']}\n\n")
+    
+    # Overall status
+    status_emoji = "✅" if analysis['summary']['overall_success'] else "❌"
+    status_text = "PASSED" if analysis['summary']['overall_success'] else "FAILED"
+    parts.append(f"## Overall Status: {status_emoji} {status_text}\n\n")
+    
+    # Summary statistics
+    parts.append("## Summary Statistics\n\n")
+    parts.append(f"- **Total Gates**: {analysis['summary']['total_gates']}\n")
+    parts.append(f"- **Passed Gates**: {analysis['summary']['passed_gates']}\n")
+    parts.append(f"- **Failed Gates**: {analysis['summary']['failed_gates']}\n")
+    
+    if analysis['summary']['total_gates'] > 0:
+        success_rate = (analysis['summary']['passed_gates'] / analysis['summary']['total_gates']) * 100
+        parts.append(f"- **Success Rate**: {success_rate:.1f}%\n")
+    
+    parts.append("\n")
+    
+    # Individual gate results
+    if analysis['gates']:
+        parts.append("## Individual Gate Results\n\n")
+        parts.append("| Gate Name | Status |\n")
+        parts.append("|-----------|--------|\n")
         
-        f.write("\n")
+        for gate_name, gate_result in analysis['gates'].items():
+            status_emoji = "✅" if gate_result else "❌"
+            status_text = "PASS" if gate_result else "FAIL"
+            parts.append(f"| {gate_name} | {status_emoji} {status_text} |\n")
         
-        # Individual gate results
-        if analysis['gates']:
-            f.write("## Individual Gate Results\n\n")
-            f.write("| Gate Name | Status |\n")
-            f.write("|-----------|--------|\n")
-            
-            for gate_name, gate_result in analysis['gates'].items():
-                status_emoji = "✅" if gate_result else "❌"
-                status_text = "PASS" if gate_result else "FAIL"
-                f.write(f"| {gate_name} | {status_emoji} {status_text} |\n")
-            
-            f.write("\n")
+        parts.append("\n")
+    
+    # Performance data summary
+    if analysis['performance_data']:
+        parts.append("## Performance Data Summary\n\n")
         
-        # Performance data summary
-        if analysis['performance_data']:
-            f.write("## Performance Data Summary\n\n")
+        for report_name, data in analysis['performance_data'].items():
+            parts.append(f"### {report_name}\n\n")
             
-            for report_name, data in analysis['performance_data'].items():
-                f.write(f"### {report_name}\n\n")
+            column_stats = numeric_column_stats(data)
+            if column_stats:
+                parts.append("| Metric | Min | Max | Average |\n")
+                parts.append("|--------|-----|-----|----------|\n")
                 
-                if data and isinstance(data, list) and len(data) > 0:
-                    # Calculate basic statistics for numeric columns
-                    numeric_columns = []
-                    for key, value in data[0].items():
-                        if isinstance(value, (int, float)):
-                            numeric_columns.append(key)
-                    
-                    if numeric_columns:
-                        f.write("| Metric | Min | Max | Average |\n")
-                        f.write("|--------|-----|-----|----------|\n")
-                        
-                        for col in numeric_columns:
-                            values = [row[col] for row in data if isinstance(row.get(col), (int, float))]
-                            if values:
-                                min_val = min(values)
-                                max_val = max(values)
-                                avg_val = sum(values) / len(values)
-                                f.write(f"| {col} | {min_val:.2f} | {max_val:.2f} | {avg_val:.2f} |\n")
-                        
-                        f.write("\n")
+                for col, min_val, max_val, avg_val in column_stats:
+                    parts.append(f"| {col} | {min_val:.2f} | {max_val:.2f} | {avg_val:.2f} |\n")
                 
-                f.write(f"**Data Points**: {len(data)}\n\n")
-        
-        # Reports summary
-        if analysis['reports']:
-            f.write("## Available Reports\n\n")
-            
-            for report in analysis['reports']:
-                f.write(f"- **{report['name']}**: {report['path']}\n")
+                parts.append("\n")
             
-            f.write("\n")
+            parts.append(f"**Data Points**: {data['row_count']}\n\n")
+    
+    # Reports summary
+    if analysis['reports']:
+        parts.append("## Available Reports\n\n")
         
-        # Recommendations
-        f.write("## Recommendations\n\n")
+        for report in analysis['reports']:
+            parts.append(f"- **{report['name']}**: {report['path']}\n")
         
-        if analysis['summary']['failed_gates'] > 0:
-            f.write("❌ **Action Required**: Some performance gates have failed.\n\n")
-            f.write("**Failed Gates:**\n")
-            for gate_name, gate_result in analysis['gates'].items():
-                if not gate_result:
-                    f.write(f"- {gate_name}\n")
-            f.write("\n")
-            f.write("**Next Steps:**\n")
-            f.write("1. Review the detailed logs for each failed gate\n")
-            f.write("2. Address the specific issues identified\n")
-            f.write("3. Re-run the performance gates\n")
-            f.write("4. Consider adjusting performance thresholds if appropriate\n")
-        else:
-            f.write("✅ **All Clear**: All performance gates have passed successfully.\n\n")
-            f.write("**Next Steps:**\n")
-            f.write("1. Proceed with build deployment\n")
-            f.write("2. Monitor performance metrics in production\n")
-            f.write("3. Consider tightening performance thresholds for continuous improvement\n")
+        parts.append("\n")
+    
+    # Recommendations
+    parts.append("## Recommendations\n\n")
+    
+    if analysis['summary']['failed_gates'] > 0:
+        parts.append("❌ **Action Required**: Some performance gates have failed.\n\n")
+        parts.append("**Failed Gates:**\n")
+        for gate_name, gate_result in analysis['gates'].items():
+            if not gate_result:
+                parts.append(f"- {gate_name}\n")
+        parts.append("\n")
+        parts.append("**Next Steps:**\n")
+        parts.append("1. Review the detailed logs for each failed gate\n")
+        parts.append("2. Address the specific issues identified\n")
+        parts.append("3. Re-run the performance gates\n")
+        parts.append("4. Consider adjusting performance thresholds if appropriate\n")
+    else:
+        parts.append("✅ **All Clear**: All performance gates have passed successfully.\n\n")
+        parts.append("**Next Steps:**\n")
+        parts.append("1. Proceed with build deployment\n")
+        parts.append("2. Monitor performance metrics in production\n")
+        parts.append("3. Consider tightening performance thresholds for continuous improvement\n")
+    
+    output_path.write_text(''.join(parts))
     
     print(f"Summary report generated: {output_path}")
     return str(output_path)
@@ -261,8 +526,13 @@ def generate_detailed_analysis(analysis, output_dir):
     
     # Save full analysis as JSON
     analysis_json_path = output_dir / 'full-analysis.json'
-    with open(analysis_json_path, 'w') as f:
-        json.dump(analysis, f, indent=2, default=str)
+    # Every value in the analysis is JSON-native by construction, so no default
+    # hook is passed: an unexpected type fails loudly instead of being stringified
+    if orjson is not None and not analysis['summary']['non_finite_values']:
+        analysis_json_path.write_bytes(orjson.dumps(analysis, option=orjson.OPT_INDENT_2))
+    else:
+        with open(analysis_json_path, 'w') as f:
+            json.dump(analysis, f, indent=2)
     
     print(f"Detailed analysis saved: {analysis_json_path}")
     
@@ -302,7 +572,7 @@ def main():
     print()
     
     # Analyze artifacts
-    analysis = analyze_artifacts_directory(args.artifacts_dir)
+    analysis = analyze_artifacts_directory(args.artifacts_dir, cache_path=output_dir / '.parse-cache.json')
     
     # Generate reports
     summary_path = generate_summary_report(analysis, args.output_dir)
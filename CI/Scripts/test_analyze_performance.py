@@ -0,0 +1,197 @@
+"""Regression tests for analyze-performance.py."""
+
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parent / 'analyze-performance.py'
+
+# The script name has a hyphen, so it is loaded from its path rather than imported.
+# It is registered in sys.modules so the parse worker processes can unpickle its functions.
+spec = importlib.util.spec_from_file_location('analyze_performance', SCRIPT_PATH)
+analyze_performance = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = analyze_performance
+spec.loader.exec_module(analyze_performance)
+
+def test_malformed_metric_does_not_drop_gates(tmp_path):
+    """A metric value float() rejects is skipped without losing the rest of the log."""
+    log_path = tmp_path / 'performance-gates.log'
+    log_path.write_text(
+        "Build ID: 1234\n"
+        "Version: 1.2.3\n"
+        "Ratio: .\n"
+        "FPS: 72.5\n"
+        "[Perf] Gate 'Memory': FAIL\n"
+        "[Perf] Gate 'FPS': PASS\n"
+        "PERFORMANCE GATES FAILED\n"
+    )
+
+    results = analyze_performance.parse_log_file(log_path)
+
+    assert results['gates'] == {'Memory': False, 'FPS': True}
+    assert results['build_id'] == '1234'
+    assert results['overall_success'] is False
+    assert results['metrics'] == {'FPS': 72.5}
+
+@pytest.fixture(params=['orjson', 'json'])
+def json_backend(request, monkeypatch):
+    """Run a test once with orjson and once with the json module fallback."""
+    if request.param == 'orjson':
+        if analyze_performance.orjson is None:
+            pytest.skip('orjson is not installed')
+    else:
+        monkeypatch.setattr(analyze_performance, 'orjson', None)
+    return request.param
+
+def test_json_report_with_non_finite_values(json_backend, tmp_path):
+    """NaN and Infinity literals parse the same with or without orjson, and are flagged."""
+    json_path = tmp_path / 'report.json'
+    json_path.write_text('{"fps": NaN, "max_frame_time": Infinity, "memory": 256}')
+
+    report, non_finite = analyze_performance.parse_json_report(json_path)
+
+    assert report['fps'] != report['fps']
+    assert report['max_frame_time'] == float('inf')
+    assert report['memory'] == 256
+    assert non_finite
+
+    json_path.write_text('{"fps": 72.5}')
+    assert analyze_performance.parse_json_report(json_path) == ({'fps': 72.5}, False)
+
+def test_non_finite_report_values_survive_full_analysis(json_backend, tmp_path):
+    """NaN/Infinity from a report are written as such, not turned into null by orjson."""
+    artifacts = tmp_path / 'artifacts'
+    artifacts.mkdir()
+    (artifacts / 'report.json').write_text('{"max_frame_time": Infinity}')
+    output_dir = tmp_path / 'output'
+
+    analysis = analyze_performance.analyze_artifacts_directory(artifacts)
+    analyze_performance.generate_detailed_analysis(analysis, output_dir)
+
+    assert analysis['summary']['non_finite_values']
+    written = json.loads((output_dir / 'full-analysis.json').read_text())
+    assert written['reports'][0]['data'] == {'max_frame_time': float('inf')}
+
+@pytest.fixture(params=['pandas', 'csv'])
+def csv_backend(request, monkeypatch):
+    """Run a test once with the pandas reader and once with the csv module fallback."""
+    if request.param == 'pandas':
+        if analyze_performance.pd is None:
+            pytest.skip('pandas is not installed')
+    else:
+        monkeypatch.setattr(analyze_performance, 'pd', None)
+    # Small chunks so multi-chunk aggregation is exercised
+    monkeypatch.setattr(analyze_performance, 'CSV_CHUNK_ROWS', 2)
+    return request.param
+
+@pytest.mark.parametrize('content, expected', [
+    # Text-only and header-only reports have no numeric columns
+    ("gate,status\nFPS,PASS\nMemory,FAIL\nCPU,PASS\n", {'row_count': 3, 'columns': {}}),
+    ("gate,status\n", {'row_count': 0, 'columns': {}}),
+    ("", {'row_count': 0, 'columns': {}}),
+    # Text and blank cells; a column with any text cell is not numeric
+    (
+        "fps,gate,memory\n72.5,ok,100\n60,bad,\n,ok,x\n",
+        {'row_count': 3, 'columns': {'fps': {'count': 2, 'min': 60.0, 'max': 72.5, 'sum': 132.5}}}
+    ),
+    # inf/nan/NA cells make the column text rather than poisoning the aggregates
+    (
+        "fps,memory,cpu\n3,1,NA\ninf,2,4\n4,3,nan\n",
+        {'row_count': 3, 'columns': {'memory': {'count': 3, 'min': 1.0, 'max': 3.0, 'sum': 6.0}}}
+    ),
+    # Repeated and blank headers are named as pandas names them
+    (
+        "a,a,,a.1\n1,2,3,4\n",
+        {'row_count': 1, 'columns': {
+            'a': {'count': 1, 'min': 1.0, 'max': 1.0, 'sum': 1.0},
+            'a.2': {'count': 1, 'min': 2.0, 'max': 2.0, 'sum': 2.0},
+            'Unnamed: 2': {'count': 1, 'min': 3.0, 'max': 3.0, 'sum': 3.0},
+            'a.1': {'count': 1, 'min': 4.0, 'max': 4.0, 'sum': 4.0}
+        }}
+    ),
+], ids=['text-only', 'header-only', 'empty', 'mixed', 'non-finite', 'duplicate-headers'])
+def test_csv_report(csv_backend, tmp_path, capsys, content, expected):
+    """Both CSV backends aggregate the same reports to the same result, without errors."""
+    csv_path = tmp_path / 'report.csv'
+    csv_path.write_text(content)
+
+    assert analyze_performance.parse_csv_report(csv_path) == expected
+    assert 'Error' not in capsys.readouterr().out
+
+def write_gates_log(log_path, result):
+    """Write a performance-gates.log reporting one gate with the given result."""
+    verdict = 'ALL PERFORMANCE GATES PASSED' if result == 'PASS' else 'PERFORMANCE GATES FAILED'
+    log_path.write_text(f"[Perf] Gate 'FPS': {result}\n{verdict}\n")
+
+def test_parse_cache_reuses_unchanged_logs(tmp_path, capsys):
+    """Unchanged logs come from the parse cache; a rewritten log is parsed again."""
+    artifacts = tmp_path / 'artifacts'
+    artifacts.mkdir()
+    log_path = artifacts / 'performance-gates.log'
+    cache_path = tmp_path / '.parse-cache.json'
+    write_gates_log(log_path, 'PASS')
+
+    first = analyze_performance.analyze_artifacts_directory(artifacts, cache_path=cache_path)
+    assert first['gates'] == {'FPS': True}
+    assert 'Parsing log file' in capsys.readouterr().out
+
+    second = analyze_performance.analyze_artifacts_directory(artifacts, cache_path=cache_path)
+    assert second['gates'] == {'FPS': True}
+    assert 'Using cached results' in capsys.readouterr().out
+
+    # Rewriting the log changes its size and mtime, which invalidates the cached result
+    write_gates_log(log_path, 'FAIL')
+    stat = log_path.stat()
+    os.utime(log_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    third = analyze_performance.analyze_artifacts_directory(artifacts, cache_path=cache_path)
+    assert third['gates'] == {'FPS': False}
+    assert third['summary']['failed_gates'] == 1
+    assert 'Parsing log file' in capsys.readouterr().out
+
+def test_dangling_log_symlink_is_reported_not_fatal(tmp_path, capsys):
+    """A log that cannot be stat'ed is reported as a parse error and not cached."""
+    artifacts = tmp_path / 'artifacts'
+    artifacts.mkdir()
+    (artifacts / 'missing.log').symlink_to(tmp_path / 'does-not-exist.log')
+    cache_path = tmp_path / '.parse-cache.json'
+
+    analysis = analyze_performance.analyze_artifacts_directory(artifacts, cache_path=cache_path)
+
+    assert analysis['gates'] == {}
+    assert 'Error parsing log file' in capsys.readouterr().out
+    assert analyze_performance.load_parse_cache(cache_path) == {}
+
+def test_analyze_artifacts_merges_logs_and_reports(tmp_path):
+    """Several artifacts are parsed in worker processes and merged into one analysis."""
+    artifacts = tmp_path / 'artifacts'
+    (artifacts / 'unity').mkdir(parents=True)
+    # Sorts after performance-gates.log by path, but the dedicated log still wins
+    (artifacts / 'unity' / 'zz-editor.log').write_text(
+        "[Perf] Gate 'FPS': PASS\n"
+        "[Perf] Gate 'Memory': PASS\n"
+        "[Perf] Gate 'FPS': PASS\n"
+    )
+    (artifacts / 'performance-gates.log').write_text(
+        "Build ID: 42\n"
+        "[Perf] Gate 'Memory': FAIL\n"
+        "[Perf] Gate 'CPU': PASS\n"
+        "PERFORMANCE GATES FAILED\n"
+    )
+    (artifacts / 'frames.csv').write_text("fps\n70\n74\n")
+    (artifacts / 'report.json').write_text(json.dumps({'fps': 72}))
+
+    analysis = analyze_performance.analyze_artifacts_directory(artifacts)
+
+    assert analysis['gates'] == {'FPS': True, 'Memory': False, 'CPU': True}
+    # Each gate is counted once, however many logs report it
+    assert analysis['summary']['total_gates'] == 3
+    assert analysis['summary']['passed_gates'] == 2
+    assert analysis['summary']['failed_gates'] == 1
+    assert analysis['performance_data']['frames']['columns']['fps'] == {
+        'count': 2, 'min': 70.0, 'max': 74.0, 'sum': 144.0
+    }
+    assert [report['data'] for report in analysis['reports']] == [{'fps': 72}]
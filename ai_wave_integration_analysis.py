@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 
-import os
-from groq import Groq
+from concurrent.futures import ThreadPoolExecutor
 
-client = Groq(api_key=os.environ.get("GROQ_API_KEY"))
+from groq_helpers import cached_completion
 
 def analyze_ai_wave_integration():
     """Analyze how AI learning integrates with mathematical wave matrices"""
@@ -44,16 +43,12 @@ def analyze_ai_wave_integration():
     Provide specific technical implementation strategy with code examples.
     """
     
-    try:
-        response = client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
-            model="llama-3.3-70b-versatile",
-            temperature=0.6,
-            max_tokens=2500
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"Error: {e}"
+    return cached_completion(
+        prompt,
+        model="llama-3.3-70b-versatile",
+        temperature=0.6,
+        max_tokens=2500
+    )
 
 def research_best_tools():
     """Research the absolute best tools for our mission"""
@@ -91,23 +86,24 @@ def research_best_tools():
     Provide specific recommendations with performance benchmarks and integration complexity.
     """
     
-    try:
-        response = client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
-            model="llama-3.3-70b-versatile",
-            temperature=0.7,
-            max_tokens=2500
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"Error: {e}"
+    return cached_completion(
+        prompt,
+        model="llama-3.3-70b-versatile",
+        temperature=0.7,
+        max_tokens=2500
+    )
 
 if __name__ == "__main__":
+    # Both analyses are independent network calls, so run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        integration_future = executor.submit(analyze_ai_wave_integration)
+        tools_future = executor.submit(research_best_tools)
+    
     print("=== AI + WAVE MATRICES INTEGRATION ANALYSIS ===")
-    integration = analyze_ai_wave_integration()
+    integration = integration_future.result()
     print(integration)
     print("\n" + "="*60 + "\n")
     
     print("=== BEST TOOLS RESEARCH ===")
-    tools = research_best_tools()
+    tools = tools_future.result()
     print(tools)
\ No newline at end of file
@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 
-import os
-from groq import Groq
+from concurrent.futures import ThreadPoolExecutor
 
-client = Groq(api_key=os.environ.get("GROQ_API_KEY"))
+from groq_helpers import cached_completion
 
 def verify_technical_claims():
     """Verify all technical performance and capability claims"""
@@ -45,16 +44,12 @@ def verify_technical_claims():
     Provide honest, technical assessment of each claim's validity.
     """
     
-    try:
-        response = client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
-            model="llama-3.3-70b-versatile",
-            temperature=0.3,
-            max_tokens=2500
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"Error: {e}"
+    return cached_completion(
+        prompt,
+        model="llama-3.3-70b-versatile",
+        temperature=0.3,
+        max_tokens=2500
+    )
 
 def verify_market_claims():
     """Verify market opportunity and competitive advantage claims"""
@@ -93,16 +88,12 @@ def verify_market_claims():
     Provide realistic assessment of market viability and competitive position.
     """
     
-    try:
-        response = client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
-            model="llama-3.3-70b-versatile",
-            temperature=0.3,
-            max_tokens=2500
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"Error: {e}"
+    return cached_completion(
+        prompt,
+        model="llama-3.3-70b-versatile",
+        temperature=0.3,
+        max_tokens=2500
+    )
 
 def verify_implementation_completeness():
     """Verify that claimed implementations actually exist and work"""
@@ -142,31 +133,33 @@ def verify_implementation_completeness():
     Provide honest assessment of implementation reality vs claims.
     """
     
-    try:
-        response = client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
-            model="llama-3.3-70b-versatile",
-            temperature=0.3,
-            max_tokens=2500
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"Error: {e}"
+    return cached_completion(
+        prompt,
+        model="llama-3.3-70b-versatile",
+        temperature=0.3,
+        max_tokens=2500
+    )
 
 if __name__ == "__main__":
     print("=== COMPREHENSIVE CLAIMS VERIFICATION ===")
     
+    # The three verifications are independent network calls, so run them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        technical_future = executor.submit(verify_technical_claims)
+        market_future = executor.submit(verify_market_claims)
+        implementation_future = executor.submit(verify_implementation_completeness)
+    
     print("\n1. TECHNICAL CLAIMS VERIFICATION")
     print("="*50)
-    technical_verification = verify_technical_claims()
+    technical_verification = technical_future.result()
     print(technical_verification)
     
     print("\n2. MARKET CLAIMS VERIFICATION")
     print("="*50)
-    market_verification = verify_market_claims()
+    market_verification = market_future.result()
     print(market_verification)
     
     print("\n3. IMPLEMENTATION COMPLETENESS VERIFICATION")
     print("="*50)
-    implementation_verification = verify_implementation_completeness()
+    implementation_verification = implementation_future.result()
     print(implementation_verification)
\ No newline at end of file
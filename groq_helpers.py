@@ -0,0 +1,211 @@
+"""Shared helpers for the Groq-backed analysis scripts"""
+
+import functools
+import hashlib
+import json
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+
+import httpx
+from groq import APIConnectionError, Groq, InternalServerError, RateLimitError
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+except ImportError:
+    h2 = None
+
+# Responses are cached across runs, keyed on everything that shapes the completion
+CACHE_PATH = Path.home() / ".cache" / "groq_responses.sqlite"
+
+# A single-line numbered list item ("3. Which libraries ...?"). With ignore_list_order=True
+# the items of each such list are compared as a set, so reordered questions share a cache
+# entry; every other line, including the item text itself, must still match exactly.
+NUMBERED_ITEM_RE = re.compile(r"^(\s*)\d+\.\s+(.*\S)\s*$")
+
+# Rate limits, dropped connections and 5xx responses are retried up to MAX_RETRIES times
+# with exponential backoff (1s, 2s, 4s, 8s, 16s) plus jitter; anything else fails immediately.
+# A server's Retry-After is waited out in full, up to RETRY_AFTER_MAX, so retries do not
+# land inside the rate-limit window.
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+MAX_RETRIES = 5
+BACKOFF_INITIAL = 1.0
+BACKOFF_MAX = 16.0
+RETRY_AFTER_MAX = 120.0
+
+# The scripts call the API from worker threads; the lock makes sure the first calls
+# racing each other still build only one client and connection pool
+_client_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _build_client():
+    """Create the Groq client on first use so importing a script costs no connection setup"""
+    api_key = os.environ.get("GROQ_API_KEY")
+    if not api_key:
+        raise RuntimeError("GROQ_API_KEY is not set; export it before running the analysis scripts")
+    # One pooled connection is shared by every request; with h2 installed the concurrent
+    # analyses are multiplexed over it instead of each opening its own TLS connection
+    http_client = httpx.Client(
+        http2=h2 is not None,
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60),
+        timeout=httpx.Timeout(60.0, connect=5.0)
+    )
+    # Retries are handled by _create so the backoff schedule lives in one place
+    return Groq(api_key=api_key, http_client=http_client, max_retries=0)
+
+def get_client():
+    """Return the shared Groq client, which is safe to use from several threads at once"""
+    with _client_lock:
+        return _build_client()
+
+def _connect():
+    """Open the response cache, creating it on first use"""
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CACHE_PATH, timeout=30)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS completions "
+        "(key TEXT PRIMARY KEY, params_key TEXT, prompt TEXT, content TEXT)"
+    )
+    return conn
+
+def _hash(payload):
+    """SHA-256 of a JSON-serializable payload"""
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+def _params_key(model, system, temperature, max_tokens, stop, seed):
+    """Hash of every request parameter except the prompt"""
+    return _hash(
+        {
+            "model": model,
+            "system": system,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stop": stop,
+            "seed": seed
+        }
+    )
+
+def _lookup(conn, key):
+    """Return the cached response for this exact request, else None"""
+    row = conn.execute("SELECT content FROM completions WHERE key = ?", (key,)).fetchone()
+    return row[0] if row is not None else None
+
+def _indent(line):
+    """Number of leading whitespace characters in line"""
+    return len(line) - len(line.lstrip())
+
+def _unordered_prompt(prompt):
+    """Prompt with the items of each single-line numbered list sorted and unnumbered
+
+    An item followed by more deeply indented lines (like the libraries data entries)
+    carries structure beyond its own line, so it stays verbatim and in place.
+    """
+    lines = prompt.splitlines()
+    canonical, items = [], []
+    for i, line in enumerate(lines):
+        match = NUMBERED_ITEM_RE.match(line)
+        next_line = lines[i + 1] if i + 1 < len(lines) else ""
+        continued = next_line.strip() != "" and _indent(next_line) > _indent(line)
+        if match and not continued:
+            items.append(match.group(2))
+            continue
+        canonical.extend(sorted(items))
+        items = []
+        canonical.append(line)
+    canonical.extend(sorted(items))
+    return "\n".join(canonical)
+
+def _store(conn, key, params_key, prompt, content):
+    """Save a response under its request key"""
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO completions (key, params_key, prompt, content) VALUES (?, ?, ?, ?)",
+            (key, params_key, prompt, content)
+        )
+
+def _retry_delay(error, attempt):
+    """Seconds to wait before the next attempt, honoring the server's Retry-After when sent"""
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    try:
+        return min(max(float(retry_after), 0.0), RETRY_AFTER_MAX)
+    except (TypeError, ValueError):
+        delay = min(BACKOFF_INITIAL * 2 ** attempt, BACKOFF_MAX)
+        return delay + random.uniform(0, 1)
+
+def _create(**request):
+    """Send a chat completion request, retrying transient failures"""
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return get_client().chat.completions.create(**request)
+        except RETRYABLE_ERRORS as e:
+            if attempt == MAX_RETRIES:
+                raise
+            time.sleep(_retry_delay(e, attempt))
+
+def cache_enabled():
+    """Set GROQ_CACHE_DISABLE=1 to always call the API and leave the cache untouched"""
+    return os.environ.get("GROQ_CACHE_DISABLE") != "1"
+
+def cached_completion(prompt, model, temperature, max_tokens, system=None, stop=None, seed=None,
+                      ignore_list_order=False, stream=None):
+    """Return the completion for prompt, reusing the stored response when the same request ran before
+
+    Static context belongs in system, which is sent first as the system message.
+    Generation ends early at any of the stop sequences, which are not included in the response.
+    A seed with temperature 0 asks the API for repeatable output across runs.
+    With ignore_list_order, a cached prompt that differs only in the order of its numbered
+    questions also counts as a hit.
+    When stream is a writable text file, the response is written to it as it is generated.
+    """
+    use_cache = cache_enabled()
+    params_key = _params_key(model, system, temperature, max_tokens, stop, seed)
+    if ignore_list_order:
+        key = _hash([params_key, _unordered_prompt(prompt), "unordered"])
+    else:
+        key = _hash([params_key, prompt])
+    if use_cache:
+        with closing(_connect()) as conn:
+            cached = _lookup(conn, key)
+        if cached is not None:
+            if stream is not None:
+                stream.write(cached)
+            return cached
+
+    messages = [{"role": "user", "content": prompt}]
+    if system is not None:
+        messages.insert(0, {"role": "system", "content": system})
+    request = {
+        "messages": messages,
+        "model": model,
+        "temperature": temperature,
+        "max_tokens": max_tokens
+    }
+    if stop is not None:
+        request["stop"] = stop
+    if seed is not None:
+        request["seed"] = seed
+    if stream is None:
+        response = _create(**request)
+        content = response.choices[0].message.content
+    else:
+        parts = []
+        for chunk in _create(stream=True, **request):
+            text = chunk.choices[0].delta.content or ""
+            stream.write(text)
+            stream.flush()
+            parts.append(text)
+        content = "".join(parts)
+
+    if not use_cache:
+        return content
+
+    # Only successful responses reach the cache; API errors propagate to the caller
+    with closing(_connect()) as conn:
+        _store(conn, key, params_key, prompt, content)
+    return content
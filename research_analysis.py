@@ -1,15 +1,25 @@
 #!/usr/bin/env python3
 
 import os
-from groq import Groq
+import re
+import sys
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-# Initialize Groq client
-client = Groq(api_key=os.environ.get("GROQ_API_KEY"))
+from groq_helpers import cache_enabled, cached_completion
 
-def analyze_spatial_libraries():
-    """Analyze the spatial computing libraries for XR bubble integration"""
-    
-    libraries_data = """
+# Every request shares this system message, so the persona is tokenized once per
+# prefix-cache entry and only the user turn differs between the analyses
+SYSTEM_PROMPT = textwrap.dedent("""
+    You are a startup CTO performing brutally honest technical analysis for an XR bubble
+    interface system built with Unity for Quest 3. Be specific and practical about
+    performance, implementation effort and competitive advantage.
+    """).strip()
+
+# Static reference data for the spatial libraries analysis. It opens the user message,
+# ahead of the questions, so the static text stays in front of the dynamic part.
+LIBRARIES_DATA = textwrap.dedent("""
     SPATIAL COMPUTING LIBRARIES ANALYSIS:
     
     1. k-Wave (MATLAB/C++): Time-domain acoustic wave propagation simulation
@@ -50,12 +60,35 @@ def analyze_spatial_libraries():
     - No advanced matrix-based wave simulation
     - No GPU acceleration
     - No real-time wave field synthesis
-    """
-    
-    prompt = f"""
-    As a CTO analyzing advanced spatial computing libraries for an XR bubble interface system, evaluate this data:
-    
-    {libraries_data}
+    """).strip()
+
+# The enumerative analyses are served by the smaller, faster model tier;
+# the implementation strategy (and the combined request) keep the 70B model
+FAST_MODEL = "llama-3.1-8b-instant"
+STRATEGY_MODEL = "llama-3.3-70b-versatile"
+
+# Greedy decoding with a fixed seed keeps repeated runs identical, so the response
+# cache and the provider's prompt cache both see the same requests every time
+TEMPERATURE = 0
+SEED = 42
+
+# Each answer is asked to finish with this marker, which is also sent as a stop sequence,
+# so generation ends as soon as the answer is complete rather than running to max_tokens
+END_MARKER = "=== END ==="
+END_INSTRUCTION = f"\nEnd your response with '{END_MARKER}' on its own line."
+
+# Finished analyses are saved here and reused until this script changes,
+# unless GROQ_CACHE_DISABLE=1 is set
+OUTPUT_DIR = Path(__file__).resolve().parent / "out"
+OUTPUT_NAMES = ("spatial", "ai", "impl")
+
+# Splits the combined reply into its per-analysis sections
+SECTION_MARKER_RE = re.compile(r"^\s*===SECTION \d+===\s*$", re.MULTILINE)
+
+# Prompts are static, so they are built once at import and shared with the combined request.
+# Source indentation is dedented away so it is not sent (and billed) as input tokens.
+SPATIAL_PROMPT = textwrap.dedent("""
+    Evaluate the advanced spatial computing libraries above for our XR bubble interface system.
     
     CRITICAL ANALYSIS NEEDED:
     1. Which of these libraries could revolutionize our XR bubble physics?
@@ -68,25 +101,10 @@ def analyze_spatial_libraries():
     
     Be brutally honest about what we're missing and what we could gain.
     Focus on practical implementation and real performance benefits.
-    """
-    
-    try:
-        response = client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
-            model="llama-3.3-70b-versatile",
-            temperature=0.7,
-            max_tokens=2000
-        )
-        
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"Error: {e}"
-
-def analyze_ai_integration_opportunities():
-    """Analyze how AI could enhance these advanced libraries"""
-    
-    prompt = """
-    As a startup CTO, analyze how Groq AI + Google Cloud could enhance these advanced spatial computing libraries:
+    """).strip()
+
+AI_INTEGRATION_PROMPT = textwrap.dedent("""
+    Analyze how Groq AI + Google Cloud could enhance these advanced spatial computing libraries:
     
     INTEGRATION OPPORTUNITIES:
     1. AI-powered wave parameter optimization
@@ -105,24 +123,9 @@ def analyze_ai_integration_opportunities():
     
     Focus on revolutionary capabilities that would be impossible without AI.
     Consider latency, cost, and competitive advantage.
-    """
-    
-    try:
-        response = client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
-            model="llama-3.3-70b-versatile",
-            temperature=0.8,
-            max_tokens=2000
-        )
-        
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"Error: {e}"
-
-def generate_implementation_strategy():
-    """Generate specific implementation strategy"""
-    
-    prompt = """
+    """).strip()
+
+IMPLEMENTATION_PROMPT = textwrap.dedent("""
     Generate a specific technical implementation strategy for integrating advanced wave libraries with AI:
     
     REQUIREMENTS:
@@ -141,31 +144,151 @@ def generate_implementation_strategy():
     6. Competitive advantage analysis
     
     Be specific about code architecture, API integration, and performance targets.
-    """
-    
-    try:
-        response = client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
-            model="llama-3.3-70b-versatile",
-            temperature=0.6,
-            max_tokens=2500
-        )
-        
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"Error: {e}"
+    """).strip()
+
+# The full prompt for each request, with the end marker instruction already appended
+SPATIAL_REQUEST = LIBRARIES_DATA + "\n\n" + SPATIAL_PROMPT + END_INSTRUCTION
+AI_INTEGRATION_REQUEST = AI_INTEGRATION_PROMPT + END_INSTRUCTION
+IMPLEMENTATION_REQUEST = IMPLEMENTATION_PROMPT + END_INSTRUCTION
+COMBINED_PROMPT = "\n".join([
+    LIBRARIES_DATA,
+    "",
+    "Answer the three independent requests below.",
+    "Begin each answer with a line containing only its marker: ===SECTION 1===, ===SECTION 2===, ===SECTION 3===.",
+    "",
+    "REQUEST 1:",
+    SPATIAL_PROMPT,
+    "REQUEST 2:",
+    AI_INTEGRATION_PROMPT,
+    "REQUEST 3:",
+    IMPLEMENTATION_PROMPT,
+    END_INSTRUCTION
+])
+
+# The two enumerative analyses ask numbered questions whose order does not change the
+# answer, so a reordered question list reuses the cached response
+def analyze_spatial_libraries(stream=None):
+    """Analyze the spatial computing libraries for XR bubble integration"""
+    return cached_completion(
+        SPATIAL_REQUEST,
+        system=SYSTEM_PROMPT,
+        model=FAST_MODEL,
+        temperature=TEMPERATURE,
+        seed=SEED,
+        max_tokens=1200,
+        stop=[END_MARKER],
+        ignore_list_order=True,
+        stream=stream
+    )
+
+def analyze_ai_integration_opportunities(stream=None):
+    """Analyze how AI could enhance these advanced libraries"""
+    return cached_completion(
+        AI_INTEGRATION_REQUEST,
+        system=SYSTEM_PROMPT,
+        model=FAST_MODEL,
+        temperature=TEMPERATURE,
+        seed=SEED,
+        max_tokens=1200,
+        stop=[END_MARKER],
+        ignore_list_order=True,
+        stream=stream
+    )
+
+def generate_implementation_strategy(stream=None):
+    """Generate specific implementation strategy"""
+    return cached_completion(
+        IMPLEMENTATION_REQUEST,
+        system=SYSTEM_PROMPT,
+        model=STRATEGY_MODEL,
+        temperature=TEMPERATURE,
+        seed=SEED,
+        max_tokens=1800,
+        stop=[END_MARKER],
+        stream=stream
+    )
+
+def analyze_all_combined():
+    """Answer all three analyses in a single request, falling back to separate calls"""
+    
+    content = cached_completion(
+        COMBINED_PROMPT,
+        system=SYSTEM_PROMPT,
+        model=STRATEGY_MODEL,
+        temperature=TEMPERATURE,
+        seed=SEED,
+        max_tokens=4200,
+        stop=[END_MARKER]
+    )
+    sections = [section.strip() for section in SECTION_MARKER_RE.split(content)[1:]]
+    if len(sections) == 3:
+        return sections
+    
+    # The reply was not usable as three sections, so ask for each analysis on its own
+    return [
+        analyze_spatial_libraries(),
+        analyze_ai_integration_opportunities(),
+        generate_implementation_strategy()
+    ]
+
+def load_output(name):
+    """Return the saved analysis if it is newer than this script, else None"""
+    # GROQ_CACHE_DISABLE=1 means always call the API, so saved analyses are not reused either
+    if not cache_enabled():
+        return None
+    path = OUTPUT_DIR / f"{name}.md"
+    if path.exists() and path.stat().st_mtime > Path(__file__).stat().st_mtime:
+        return path.read_text(encoding="utf-8")
+    return None
+
+def save_output(name, text):
+    """Save an analysis for later runs to reuse"""
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    (OUTPUT_DIR / f"{name}.md").write_text(text, encoding="utf-8")
+
+def run_or_load(name, analyze, stream=None):
+    """Reuse the saved analysis when it is current, otherwise run it and save the result"""
+    text = load_output(name)
+    if text is None:
+        text = analyze(stream=stream)
+        save_output(name, text)
+    elif stream is not None:
+        stream.write(text)
+    return text
 
 if __name__ == "__main__":
-    print("=== SPATIAL COMPUTING LIBRARIES ANALYSIS ===")
-    analysis = analyze_spatial_libraries()
-    print(analysis)
-    print("\n" + "="*60 + "\n")
-    
-    print("=== AI INTEGRATION OPPORTUNITIES ===")
-    ai_analysis = analyze_ai_integration_opportunities()
-    print(ai_analysis)
-    print("\n" + "="*60 + "\n")
-    
-    print("=== IMPLEMENTATION STRATEGY ===")
-    strategy = generate_implementation_strategy()
-    print(strategy)
\ No newline at end of file
+    separator = "\n" + "="*60 + "\n"
+    if os.environ.get("GROQ_BATCH") == "1":
+        # One round-trip for all three analyses, at the cost of generating them serially
+        outputs = [load_output(name) for name in OUTPUT_NAMES]
+        if None in outputs:
+            outputs = analyze_all_combined()
+            for name, text in zip(OUTPUT_NAMES, outputs):
+                save_output(name, text)
+        analysis, ai_analysis, strategy = outputs
+        parts = ["=== SPATIAL COMPUTING LIBRARIES ANALYSIS ===", analysis, separator]
+    else:
+        # The three analyses are independent network calls, so run them concurrently.
+        # The first streams to stdout as it generates while the others finish in the background.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ai_analysis_future = executor.submit(run_or_load, "ai", analyze_ai_integration_opportunities)
+            strategy_future = executor.submit(run_or_load, "impl", generate_implementation_strategy)
+            
+            print("=== SPATIAL COMPUTING LIBRARIES ANALYSIS ===", flush=True)
+            analysis = run_or_load("spatial", analyze_spatial_libraries, stream=sys.stdout)
+            print()
+            print(separator, flush=True)
+        ai_analysis = ai_analysis_future.result()
+        strategy = strategy_future.result()
+        parts = []
+    
+    # The finished sections go out in a single write rather than one print per block
+    parts += [
+        "=== AI INTEGRATION OPPORTUNITIES ===",
+        ai_analysis,
+        separator,
+        "=== IMPLEMENTATION STRATEGY ===",
+        strategy
+    ]
+    sys.stdout.write("\n".join(parts) + "\n")
+    sys.stdout.flush()
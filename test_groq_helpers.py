@@ -0,0 +1,137 @@
+"""Tests for the Groq response cache in groq_helpers"""
+
+import types
+
+import httpx
+import pytest
+from groq import RateLimitError
+
+import groq_helpers
+import research_analysis
+
+@pytest.fixture
+def completions(tmp_path, monkeypatch):
+    """Route requests to a fake API that records them, with the cache in tmp_path"""
+    requests = []
+
+    def create(**request):
+        requests.append(request)
+        message = types.SimpleNamespace(content=f"response {len(requests)}")
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(groq_helpers, "CACHE_PATH", tmp_path / "cache.sqlite")
+    monkeypatch.setattr(groq_helpers, "_create", create)
+    monkeypatch.delenv("GROQ_CACHE_DISABLE", raising=False)
+    return requests
+
+def swap_items(prompt, first, second, occurrence=-1):
+    """Swap the text of two numbered items while keeping their numbers in place
+
+    occurrence picks which list to edit when several use the same numbers.
+    """
+    lines = prompt.splitlines()
+    items = {first: [], second: []}
+    for i, line in enumerate(lines):
+        number, sep, text = line.partition(". ")
+        if sep and number in items:
+            items[number].append((i, text))
+    (i, first_text), (j, second_text) = items[first][occurrence], items[second][occurrence]
+    lines[i], lines[j] = f"{first}. {second_text}", f"{second}. {first_text}"
+    return "\n".join(lines)
+
+def complete(prompt):
+    """Request prompt the way the enumerative research analyses do"""
+    return groq_helpers.cached_completion(
+        prompt,
+        system=research_analysis.SYSTEM_PROMPT,
+        model=research_analysis.FAST_MODEL,
+        temperature=research_analysis.TEMPERATURE,
+        seed=research_analysis.SEED,
+        max_tokens=1200,
+        stop=[research_analysis.END_MARKER],
+        ignore_list_order=True
+    )
+
+@pytest.mark.parametrize("prompt, first, second", [
+    (research_analysis.SPATIAL_REQUEST, "1", "7"),
+    (research_analysis.AI_INTEGRATION_REQUEST, "1", "5")
+])
+def test_reordered_questions_hit(completions, prompt, first, second):
+    """Reordering the numbered questions reuses the cached response"""
+    reordered = swap_items(prompt, first, second)
+    assert reordered != prompt
+
+    assert complete(prompt) == complete(reordered)
+    assert len(completions) == 1
+
+@pytest.mark.parametrize("prompt, edits", [
+    (research_analysis.SPATIAL_REQUEST, [("Quest 3", "Vision Pro")]),
+    (research_analysis.AI_INTEGRATION_REQUEST, [("Quest 3", "Vision Pro"), ("Groq", "OpenAI")])
+])
+def test_changed_platform_misses(completions, prompt, edits):
+    """Changing the platform or provider named in the prompt is a new request"""
+    edited = prompt
+    for old, new in edits:
+        assert old in edited
+        edited = edited.replace(old, new)
+
+    assert complete(prompt) != complete(edited)
+    assert len(completions) == 2
+
+def test_reordered_library_entries_miss(completions):
+    """Numbered entries with indented details, like the libraries data, must match exactly"""
+    prompt = research_analysis.SPATIAL_REQUEST
+    swapped = swap_items(prompt, "1", "2", occurrence=0)
+    assert "1. RCWA (Julia)" in swapped
+
+    complete(prompt)
+    complete(swapped)
+    assert len(completions) == 2
+
+def test_list_order_matters_without_opt_in(completions):
+    """Without ignore_list_order only the exact prompt hits"""
+    prompt = research_analysis.AI_INTEGRATION_REQUEST
+    for text in (prompt, swap_items(prompt, "1", "5")):
+        groq_helpers.cached_completion(text, model="m", temperature=0, max_tokens=10)
+    assert len(completions) == 2
+
+@pytest.fixture
+def flaky_api(monkeypatch):
+    """Make the API fail with rate limits; returns the recorded sleeps and a failure setter"""
+    sleeps = []
+    state = {"failures": 0, "calls": 0, "retry_after": None}
+
+    def create(**request):
+        state["calls"] += 1
+        if state["calls"] <= state["failures"]:
+            headers = {} if state["retry_after"] is None else {"retry-after": state["retry_after"]}
+            response = httpx.Response(
+                429, headers=headers, request=httpx.Request("POST", "https://api.groq.com")
+            )
+            raise RateLimitError("rate limited", response=response, body=None)
+        return "completion"
+
+    client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create)))
+    monkeypatch.setattr(groq_helpers, "get_client", lambda: client)
+    monkeypatch.setattr(groq_helpers.time, "sleep", sleeps.append)
+    return sleeps, state
+
+def test_retries_follow_backoff_schedule(flaky_api):
+    """Five retries back off 1, 2, 4, 8 and 16 seconds (plus jitter) before giving up"""
+    sleeps, state = flaky_api
+    state["failures"] = 100
+
+    with pytest.raises(RateLimitError):
+        groq_helpers._create(model="m", messages=[])
+
+    assert state["calls"] == groq_helpers.MAX_RETRIES + 1
+    assert [int(delay) for delay in sleeps] == [1, 2, 4, 8, 16]
+
+def test_retry_after_is_honored_beyond_backoff_cap(flaky_api):
+    """A server's Retry-After longer than the backoff cap is waited out in full"""
+    sleeps, state = flaky_api
+    state["failures"] = 2
+    state["retry_after"] = "30"
+
+    assert groq_helpers._create(model="m", messages=[]) == "completion"
+    assert sleeps == [30.0, 30.0]